@@ -4,23 +4,54 @@ Airtable CLI
 """
 
 import argparse
+import gzip
+import http.client
 import json
 import os
+import re
 import sys
+import threading
 import time
-from urllib import error, parse, request
-
-META_BASE_URL = "https://api.airtable.com/v0/meta"
-DATA_BASE_URL = "https://api.airtable.com/v0"
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from urllib import parse
+
+try:
+    import orjson
+except ImportError:  # stdlib-only fallback
+    orjson = None
+
+API_HOST = "api.airtable.com"
+META_PATH = "/v0/meta"
+DATA_PATH = "/v0"
+REQUEST_TIMEOUT = 30
 RATE_LIMIT_PER_SEC = 5
-MIN_INTERVAL = 1.0 / RATE_LIMIT_PER_SEC
-
-_last_request_time = 0.0
+IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+ENV_LINE_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*$")
+NUMBER_RE = re.compile(r"^-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$")
+BOOLEAN_LITERALS = frozenset({"true", "false"})
+# Fixed envelope of record create payloads; only the per-record fields vary.
+CREATE_PREFIX = b'{"typecast":true,"records":['
+CREATE_SUFFIX = b"]}"
+
+# Token bucket: bursts of up to RATE_LIMIT_PER_SEC requests, refilled at that rate.
+_tokens = float(RATE_LIMIT_PER_SEC)
+_last_refill = time.monotonic()
+_rate_limit_lock = threading.Lock()
+_local = threading.local()  # one keep-alive connection per thread
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
 
 
 def _print_json(obj):
-    json.dump(obj, sys.stdout)
-    sys.stdout.write("\n")
+    sys.stdout.buffer.write(_dumps(obj) + b"\n")
 
 
 def _error_exit(message, code=1):
@@ -35,16 +66,12 @@ def _load_env(path=".env"):
     try:
         with open(path, "r", encoding="utf-8") as f:
             for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if "=" not in line:
+                match = ENV_LINE_RE.match(line)
+                if not match:
                     continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip().strip("'\"")
-                if key and key not in os.environ:
-                    os.environ[key] = value
+                key, value = match.groups()
+                if key not in os.environ:
+                    os.environ[key] = value.strip("'\"")
     except OSError as exc:
         _error_exit(f"Failed to read .env: {exc}")
 
@@ -69,18 +96,24 @@ def _resolve_base_id(base_override):
 
 
 def _rate_limit_sleep():
-    global _last_request_time
-    now = time.time()
-    elapsed = now - _last_request_time
-    if elapsed < MIN_INTERVAL:
-        time.sleep(MIN_INTERVAL - elapsed)
-    _last_request_time = time.time()
-
-
-def _parse_api_error(body_text):
+    global _tokens, _last_refill
+    with _rate_limit_lock:
+        now = time.monotonic()
+        _tokens = min(RATE_LIMIT_PER_SEC, _tokens + (now - _last_refill) * RATE_LIMIT_PER_SEC)
+        _last_refill = now
+        if _tokens < 1:
+            time.sleep((1 - _tokens) / RATE_LIMIT_PER_SEC)
+            _tokens = 0.0
+            _last_refill = time.monotonic()
+        else:
+            _tokens -= 1
+
+
+def _parse_api_error(body):
+    body_text = body.decode("utf-8", errors="replace")
     try:
-        data = json.loads(body_text)
-    except json.JSONDecodeError:
+        data = _loads(body)
+    except ValueError:  # JSONDecodeError, or non-UTF-8 bytes in the stdlib fallback
         return body_text.strip() or "Unknown error"
 
     if isinstance(data, dict) and "error" in data:
@@ -97,40 +130,78 @@ def _parse_api_error(body_text):
     return body_text.strip() or "Unknown error"
 
 
-def _request(token, method, url, params=None, json_body=None):
+def _get_conn():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = http.client.HTTPSConnection(API_HOST, timeout=REQUEST_TIMEOUT)
+    return conn
+
+
+def _reset_conn():
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+    _local.conn = None
+
+
+def _send(method, path, headers, data):
+    # The keep-alive connection may have been closed by the server while idle;
+    # reconnect and reissue once before treating it as a network error. Only
+    # idempotent methods are replayed: a reset after the server accepted a POST
+    # would otherwise create the records twice.
+    attempts = 2 if method in IDEMPOTENT_METHODS else 1
+    for attempt in range(1, attempts + 1):
+        conn = _get_conn()
+        try:
+            conn.request(method, path, body=data, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            if resp.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return resp.status, resp.headers, body
+        except ConnectionError:
+            _reset_conn()
+            if attempt == attempts:
+                raise
+        except (http.client.HTTPException, OSError):
+            _reset_conn()
+            raise
+
+
+def _request(token, method, path, params=None, json_body=None, query=None, raw_body=None):
     if params:
-        url = f"{url}?{parse.urlencode(params, doseq=True)}"
+        query = parse.urlencode(params, doseq=True)
+    if query:
+        path = f"{path}?{query}"
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
+        "Accept-Encoding": "gzip",
     }
-    data = None
+    data = raw_body
     if json_body is not None:
-        data = json.dumps(json_body).encode("utf-8")
+        data = _dumps(json_body)
 
     while True:
-        req = request.Request(url, method=method, headers=headers, data=data)
         try:
             _rate_limit_sleep()
-            with request.urlopen(req) as resp:
-                body = resp.read().decode("utf-8")
-                if body:
-                    return json.loads(body)
-                return {}
-        except error.HTTPError as exc:
-            body_text = exc.read().decode("utf-8")
-            if exc.code == 429:
-                retry_after = exc.headers.get("Retry-After")
-                try:
-                    wait = float(retry_after) if retry_after else 1.0
-                except ValueError:
-                    wait = 1.0
-                time.sleep(wait)
-                continue
-            message = _parse_api_error(body_text)
-            _error_exit(f"Airtable API {exc.code}: {message}")
-        except error.URLError as exc:
-            _error_exit(f"Network error: {exc.reason}")
+            status, resp_headers, body = _send(method, path, headers, data)
+        except (http.client.HTTPException, OSError) as exc:
+            _error_exit(f"Network error: {exc}")
+        if status == 429:
+            retry_after = resp_headers.get("Retry-After")
+            try:
+                wait = float(retry_after) if retry_after else 1.0
+            except ValueError:
+                wait = 1.0
+            time.sleep(wait)
+            continue
+        if status >= 400:
+            message = _parse_api_error(body)
+            _error_exit(f"Airtable API {status}: {message}")
+        if body:
+            return _loads(body)
+        return {}
 
 
 def _parse_json_arg(value, label):
@@ -141,13 +212,13 @@ def _parse_json_arg(value, label):
 
 
 def _chunk(items, size):
-    for idx in range(0, len(items), size):
-        yield items[idx : idx + size]
+    it = iter(items)
+    return iter(lambda: list(islice(it, size)), [])
 
 
 def _get_tables(token, base_id):
-    url = f"{META_BASE_URL}/bases/{base_id}/tables"
-    data = _request(token, "GET", url)
+    path = f"{META_PATH}/bases/{base_id}/tables"
+    data = _request(token, "GET", path)
     return data.get("tables", [])
 
 
@@ -161,7 +232,7 @@ def _find_table(token, base_id, table_name):
 
 def cmd_base_list(args):
     token = _get_env("AIRTABLE_API_KEY", required=True)
-    data = _request(token, "GET", f"{META_BASE_URL}/bases")
+    data = _request(token, "GET", f"{META_PATH}/bases")
     _print_json({"bases": data.get("bases", [])})
 
 
@@ -178,9 +249,9 @@ def cmd_table_create(args):
     schema = _parse_json_arg(args.schema, "schema")
     if not isinstance(schema, list):
         _error_exit("Schema must be a JSON array of field definitions")
-    url = f"{META_BASE_URL}/bases/{base_id}/tables"
+    path = f"{META_PATH}/bases/{base_id}/tables"
     payload = {"name": args.name, "fields": schema}
-    table = _request(token, "POST", url, json_body=payload)
+    table = _request(token, "POST", path, json_body=payload)
     _print_json({"table": table})
 
 
@@ -191,54 +262,64 @@ def cmd_field_add(args):
     field = {"name": args.name, "type": args.type}
     if args.options:
         field["options"] = _parse_json_arg(args.options, "options")
-    url = f"{META_BASE_URL}/bases/{base_id}/tables/{table['id']}/fields"
-    created = _request(token, "POST", url, json_body=field)
+    path = f"{META_PATH}/bases/{base_id}/tables/{table['id']}/fields"
+    created = _request(token, "POST", path, json_body=field)
     _print_json({"table": args.table_name, "field": created})
 
 
-def _record_url(base_id, table_name):
+def _record_path(base_id, table_name):
     safe_table = parse.quote(table_name, safe="")
-    return f"{DATA_BASE_URL}/{base_id}/{safe_table}"
+    return f"{DATA_PATH}/{base_id}/{safe_table}"
 
 
 def _normalize_record(record):
-    return {
-        "id": record.get("id"),
-        "fields": record.get("fields", {}),
-        "created_time": record.get("createdTime"),
-    }
+    # Rename in place: records come straight from a decoded response and are not reused.
+    record.setdefault("id", None)
+    record.setdefault("fields", {})
+    record["created_time"] = record.pop("createdTime", None)
+    return record
 
 
 def cmd_record_list(args):
     token = _get_env("AIRTABLE_API_KEY", required=True)
     base_id = _resolve_base_id(args.base)
-    url = _record_url(base_id, args.table_name)
+    path = _record_path(base_id, args.table_name)
 
-    params = {}
+    params = []
     if args.formula:
-        params["filterByFormula"] = args.formula
+        params.append(("filterByFormula", args.formula))
     if args.view:
-        params["view"] = args.view
+        params.append(("view", args.view))
     if args.max:
-        params["maxRecords"] = args.max
+        params.append(("maxRecords", args.max))
     if args.sort:
         for idx, item in enumerate(args.sort):
-            if ":" not in item:
+            field, sep, direction = item.partition(":")
+            if not sep:
                 _error_exit("Sort must be FIELD:DIR")
-            field, direction = item.split(":", 1)
-            params[f"sort[{idx}][field]"] = field
-            params[f"sort[{idx}][direction]"] = direction
+            params.extend(
+                ((f"sort[{idx}][field]", field), (f"sort[{idx}][direction]", direction))
+            )
+
+    # Encode the filter/sort query once; each page only appends its offset.
+    base_query = parse.urlencode(params)
+    offset_prefix = f"{base_query}&offset=" if base_query else "offset="
 
+    # Request page N+1 as soon as its offset is known, while page N is normalized.
     records = []
-    while True:
-        data = _request(token, "GET", url, params=params)
-        for record in data.get("records", []):
-            records.append(_normalize_record(record))
-        offset = data.get("offset")
-        if offset:
-            params["offset"] = offset
-            continue
-        break
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        data = _request(token, "GET", path, query=base_query)
+        while True:
+            offset = data.get("offset")
+            pending = None
+            if offset:
+                query = offset_prefix + parse.quote(offset, safe="")
+                pending = executor.submit(_request, token, "GET", path, query=query)
+            for record in data.get("records", []):
+                records.append(_normalize_record(record))
+            if pending is None:
+                break
+            data = pending.result()
 
     _print_json({"table": args.table_name, "total_records": len(records), "records": records})
 
@@ -246,15 +327,22 @@ def cmd_record_list(args):
 def cmd_record_get(args):
     token = _get_env("AIRTABLE_API_KEY", required=True)
     base_id = _resolve_base_id(args.base)
-    url = f"{_record_url(base_id, args.table_name)}/{args.record_id}"
-    record = _request(token, "GET", url)
+    path = f"{_record_path(base_id, args.table_name)}/{args.record_id}"
+    record = _request(token, "GET", path)
     _print_json({"table": args.table_name, "record": _normalize_record(record)})
 
 
+def _create_batch(token, path, chunk):
+    records = b",".join(b'{"fields":' + _dumps(item) + b"}" for item in chunk)
+    body = CREATE_PREFIX + records + CREATE_SUFFIX
+    data = _request(token, "POST", path, raw_body=body)
+    return list(map(_normalize_record, data.get("records", ())))
+
+
 def cmd_record_create(args):
     token = _get_env("AIRTABLE_API_KEY", required=True)
     base_id = _resolve_base_id(args.base)
-    url = _record_url(base_id, args.table_name)
+    path = _record_path(base_id, args.table_name)
     fields = _parse_json_arg(args.fields_json, "fields")
 
     if isinstance(fields, dict):
@@ -264,63 +352,87 @@ def cmd_record_create(args):
     else:
         _error_exit("FIELDS_JSON must be an object or array")
 
-    created = []
-    for chunk in _chunk(records_input, 10):
-        payload = {
-            "records": [{"fields": item} for item in chunk],
-            "typecast": True,
-        }
-        data = _request(token, "POST", url, json_body=payload)
-        for record in data.get("records", []):
-            created.append(_normalize_record(record))
+    batches = list(_chunk(records_input, 10))
+    if args.ordered or len(batches) == 1:
+        # One batch at a time: Airtable creates the records in input order.
+        created = []
+        for chunk in batches:
+            created.extend(_create_batch(token, path, chunk))
+        _print_json({"table": args.table_name, "total_records": len(created), "records": created})
+        return
+
+    # Up to RATE_LIMIT_PER_SEC batches in flight; the shared limiter paces them.
+    # Batches may be created out of order, but output stays in input order.
+    failure = None
+    with ThreadPoolExecutor(max_workers=RATE_LIMIT_PER_SEC) as executor:
+        futures = [
+            executor.submit(_create_batch, token, path, chunk)
+            for chunk in batches
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except SystemExit as exc:
+            # A batch failed and has reported why. Don't send the queued
+            # batches; still report what was created so a rerun can skip it.
+            executor.shutdown(cancel_futures=True)
+            failure = exc
+    created = [
+        record
+        for future in futures
+        if not future.cancelled() and future.exception() is None
+        for record in future.result()
+    ]
     _print_json({"table": args.table_name, "total_records": len(created), "records": created})
+    if failure is not None:
+        raise failure
 
 
 def cmd_record_update(args):
     token = _get_env("AIRTABLE_API_KEY", required=True)
     base_id = _resolve_base_id(args.base)
-    url = f"{_record_url(base_id, args.table_name)}/{args.record_id}"
+    path = f"{_record_path(base_id, args.table_name)}/{args.record_id}"
     fields = _parse_json_arg(args.fields_json, "fields")
     if not isinstance(fields, dict):
         _error_exit("FIELDS_JSON must be an object")
     payload = {"fields": fields, "typecast": True}
-    record = _request(token, "PATCH", url, json_body=payload)
+    record = _request(token, "PATCH", path, json_body=payload)
     _print_json({"table": args.table_name, "record": _normalize_record(record)})
 
 
 def cmd_record_delete(args):
     token = _get_env("AIRTABLE_API_KEY", required=True)
     base_id = _resolve_base_id(args.base)
-    url = _record_url(base_id, args.table_name)
+    path = _record_path(base_id, args.table_name)
 
     deleted = []
     for chunk in _chunk(args.record_ids, 10):
         params = [("records[]", rec_id) for rec_id in chunk]
-        data = _request(token, "DELETE", url, params=params)
-        for record in data.get("records", []):
-            deleted.append({"id": record.get("id"), "deleted": record.get("deleted")})
+        data = _request(token, "DELETE", path, params=params)
+        deleted.extend(
+            {"id": record.get("id"), "deleted": record.get("deleted")}
+            for record in data.get("records", [])
+        )
     _print_json({"table": args.table_name, "total_records": len(deleted), "records": deleted})
 
 
 def _format_formula(field_name, value):
     lower = value.lower()
-    if lower in {"true", "false"}:
+    if lower in BOOLEAN_LITERALS:
         return f"{{{field_name}}} = {lower}"
-    try:
-        float(value)
+    if NUMBER_RE.match(value):
         return f"{{{field_name}}} = {value}"
-    except ValueError:
-        escaped = value.replace("'", "\\'")
-        return f"{{{field_name}}} = '{escaped}'"
+    escaped = value.replace("'", "\\'")
+    return f"{{{field_name}}} = '{escaped}'"
 
 
 def cmd_record_find(args):
     token = _get_env("AIRTABLE_API_KEY", required=True)
     base_id = _resolve_base_id(args.base)
-    url = _record_url(base_id, args.table_name)
+    path = _record_path(base_id, args.table_name)
     formula = _format_formula(args.field_name, args.value)
     params = {"filterByFormula": formula, "maxRecords": 1}
-    data = _request(token, "GET", url, params=params)
+    data = _request(token, "GET", path, params=params)
     records = data.get("records", [])
     if not records:
         _print_json({"table": args.table_name, "found": False, "record": None})
@@ -391,6 +503,11 @@ def build_parser():
     record_create = record_sub.add_parser("create", help="Create record(s)")
     record_create.add_argument("table_name", help="Table name")
     record_create.add_argument("fields_json", help="Fields JSON object or array")
+    record_create.add_argument(
+        "--ordered",
+        action="store_true",
+        help="Create batches one at a time so Airtable keeps input order",
+    )
     _add_base_arg(record_create)
     record_create.set_defaults(func=cmd_record_create)
 
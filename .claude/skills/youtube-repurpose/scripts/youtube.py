@@ -5,6 +5,8 @@
 #   "google-api-python-client>=2.150.0",
 #   "youtube-transcript-api>=0.6.0",
 #   "requests>=2.31.0",
+#   "urllib3>=2.7.0",
+#   "orjson>=3.9.0",
 #   "python-dotenv>=1.0.0",
 # ]
 # ///
@@ -15,44 +17,85 @@ Usage:
     uv run .claude/skills/youtube-repurpose/scripts/youtube.py search_videos "AI agents" --max 20 --order view_count
     uv run .claude/skills/youtube-repurpose/scripts/youtube.py get_channel_videos @mkbhd --days 30
     uv run .claude/skills/youtube-repurpose/scripts/youtube.py get_transcript VIDEO_ID
+    uv run .claude/skills/youtube-repurpose/scripts/youtube.py get_transcripts VIDEO_ID VIDEO_ID ...
 
 Environment (auto-loaded from .env):
     YOUTUBE_API_KEY      - Required for search and channel commands.
     SUPADATA_API_KEY     - Optional, faster transcript fetching.
+
+Transcripts are cached for 7 days in ~/.cache/youtube-tool/transcripts/
+(pass --no-cache to refetch).
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import math
 import os
 import re
-import statistics
 import sys
-from dataclasses import asdict, dataclass, field
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Iterable
 
+import orjson
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    NoTranscriptFound,
-    TranscriptsDisabled,
-    VideoUnavailable,
-)
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
+CHANNEL_URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?youtube\.com/"
+    r"(?:@(?P<handle>[\w-]+)|channel/(?P<channel_id>UC[\w-]+)|c/(?P<custom>[\w-]+))"
+)
+BARE_HANDLE_RE = re.compile(r"^[\w-]+$")
+VIDEO_ID_RE = re.compile(r"^[\w-]{6,20}$")
+VIDEO_URL_RE = re.compile(
+    r"(?:[?&]v=|youtu\.be/|youtube\.com/(?:embed|shorts|live)/)(?P<video_id>[\w-]{11})"
+)
+
+# Partial-response masks: request only the keys the parsers below read.
+CHANNEL_SEARCH_FIELDS = "items(snippet(channelId))"
+CHANNEL_FIELDS = (
+    "items(id,snippet(title,customUrl),statistics(subscriberCount,videoCount),"
+    "contentDetails(relatedPlaylists(uploads)))"
+)
+CHANNEL_UPLOADS_FIELDS = "items(snippet(title),contentDetails(relatedPlaylists(uploads)))"
+PLAYLIST_ITEM_FIELDS = "nextPageToken,items(contentDetails(videoId,videoPublishedAt))"
+VIDEO_SEARCH_FIELDS = "pageInfo(totalResults),items(id(videoId))"
+VIDEO_FIELDS = (
+    "items(id,snippet(title,channelTitle,publishedAt,tags),"
+    "statistics(viewCount,likeCount,commentCount))"
+)
+
+VIDEOS_PER_REQUEST = 50  # videos().list accepts at most 50 IDs
+MAX_DETAIL_WORKERS = 8
+MAX_TRANSCRIPT_WORKERS = 8
+MAX_RETRY_AFTER = 5  # seconds; cap on a Supadata Retry-After wait
+TRANSCRIPT_CACHE_DIR = Path.home() / ".cache" / "youtube-tool" / "transcripts"
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 3600  # captions rarely change once published
+RULE = "=" * 60  # header rule for the text formatters
+
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Video:
     """A YouTube video with computed metrics."""
 
@@ -71,7 +114,7 @@ class Video:
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelInfo:
     """Information about a YouTube channel."""
 
@@ -80,9 +123,10 @@ class ChannelInfo:
     subscriber_count: int
     total_video_count: int
     handle: str | None = None
+    uploads_playlist_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelVideosResponse:
     """Response from get_channel_videos."""
 
@@ -94,17 +138,105 @@ class ChannelVideosResponse:
     videos: list[Video]
 
 
-@dataclass
+@dataclass(slots=True)
+class TopChannel:
+    """A channel's share of search results."""
+
+    name: str
+    video_count: int
+
+
+@dataclass(slots=True)
 class SearchResponse:
     """Response from search_videos."""
 
     query: str
     total_results: int
     avg_views: float
-    top_channels: list[dict]
+    top_channels: list[TopChannel]
     videos: list[Video]
 
 
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _mean_stdev(values: list[int]) -> tuple[float, float]:
+    """Return the mean and sample standard deviation of a non-empty list."""
+    # One pass over integer sums; they stay exact, so the variance formula
+    # below doesn't suffer the cancellation it would in floating point.
+    n = len(values)
+    total = total_sq = 0
+    for v in values:
+        total += v
+        total_sq += v * v
+    mean = total / n
+    if n < 2:
+        return mean, 0.0
+    variance = (n * total_sq - total * total) / (n * (n - 1))
+    return mean, math.sqrt(variance)
+
+
+def _join_capped(texts: Iterable[str], max_chars: int) -> str:
+    """Space-join transcript segments, stopping once past max_chars.
+
+    Callers still truncate; this just avoids joining text that would be cut.
+    """
+    parts = []
+    length = -1  # no separator before the first segment
+    for text in texts:
+        parts.append(text)
+        length += len(text) + 1
+        if length > max_chars:
+            break
+    return " ".join(parts)
+
+
+def _extract_video_id(video: str) -> str:
+    """Extract the video ID from a watch, youtu.be, Shorts, embed, or live URL.
+
+    Anything else (including a bare ID) is passed through unchanged.
+    """
+    match = VIDEO_URL_RE.search(video)
+    return match["video_id"] if match else video
+
+
+def _read_transcript_cache(path: Path) -> dict | None:
+    """Return a cached transcript result, or None if missing, stale, or corrupt."""
+    try:
+        if time.time() - path.stat().st_mtime >= TRANSCRIPT_CACHE_TTL:
+            return None
+        return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _write_transcript_cache(path: Path, result: dict) -> None:
+    """Write a transcript result atomically; the cache is best-effort."""
+    tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(orjson.dumps(result))
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes API responses with orjson, straight from bytes."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Match JsonModel: hand back non-JSON bodies as text.
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
 # =============================================================================
 # YouTube Service
 # =============================================================================
@@ -114,10 +246,40 @@ class YouTubeService:
     """YouTube Data API v3 wrapper for research."""
 
     def __init__(self, api_key: str):
-        self.youtube = build("youtube", "v3", developerKey=api_key)
+        self._api_key = api_key
+        # Pooled keep-alive connections for direct HTTP calls (Supadata), with
+        # a short retry on rate limits and transient server errors. Exhausted
+        # retries hand back the last response so the status is reported, and
+        # Retry-After is capped so a long 429 can't stall get_transcripts.
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                raise_on_status=False,
+                retry_after_max=MAX_RETRY_AFTER,
+            ),
+        ))
+        # Successful lookups only; errors are retried on the next call.
+        self._channels: dict[str, ChannelInfo] = {}  # channel input -> channel
+        self._channel_names: dict[str, str] = {}  # channel ID -> title
+        self._uploads_playlists: dict[str, str] = {}  # channel ID -> uploads playlist
+
+    @functools.cached_property
+    def youtube(self):
+        # Built on first use: parsing the discovery document is the slowest part
+        # of startup, and transcript commands never touch the Data API.
+        return build("youtube", "v3", developerKey=self._api_key, model=_OrjsonModel())
 
     def resolve_channel(self, channel_input: str) -> ChannelInfo | dict:
         """Resolve a channel from @handle, URL, or channel ID."""
+        cached = self._channels.get(channel_input)
+        if cached is not None:
+            return cached
+
         try:
             channel_id = self._parse_channel_input(channel_input)
             if channel_id is None:
@@ -126,7 +288,13 @@ class YouTubeService:
             if channel_id.startswith("@"):
                 search_response = (
                     self.youtube.search()
-                    .list(part="snippet", q=channel_id, type="channel", maxResults=1)
+                    .list(
+                        part="snippet",
+                        q=channel_id,
+                        type="channel",
+                        maxResults=1,
+                        fields=CHANNEL_SEARCH_FIELDS,
+                    )
                     .execute()
                 )
                 if not search_response.get("items"):
@@ -135,7 +303,11 @@ class YouTubeService:
 
             response = (
                 self.youtube.channels()
-                .list(part="snippet,statistics", id=channel_id)
+                .list(
+                    part="snippet,statistics,contentDetails",
+                    id=channel_id,
+                    fields=CHANNEL_FIELDS,
+                )
                 .execute()
             )
 
@@ -146,13 +318,21 @@ class YouTubeService:
             snippet = item["snippet"]
             stats = item["statistics"]
 
-            return ChannelInfo(
+            info = ChannelInfo(
                 channel_id=item["id"],
                 handle=snippet.get("customUrl"),
                 name=snippet["title"],
                 subscriber_count=int(stats.get("subscriberCount", 0)),
                 total_video_count=int(stats.get("videoCount", 0)),
+                uploads_playlist_id=item.get("contentDetails", {})
+                .get("relatedPlaylists", {})
+                .get("uploads"),
             )
+            self._channels[channel_input] = info
+            self._channel_names[info.channel_id] = info.name
+            if info.uploads_playlist_id:
+                self._uploads_playlists[info.channel_id] = info.uploads_playlist_id
+            return info
 
         except HttpError as e:
             return {"error": f"YouTube API error: {e.reason}"}
@@ -160,35 +340,46 @@ class YouTubeService:
             return {"error": f"Error resolving channel: {str(e)}"}
 
     def get_channel_videos(
-        self, channel_id: str, days_back: int = 30, max_results: int = 50
+        self,
+        channel_id: str,
+        days_back: int = 30,
+        max_results: int = 50,
+        channel_name: str | None = None,
     ) -> ChannelVideosResponse | dict:
-        """Get videos from a channel with performance metrics and outlier analysis."""
-        try:
-            channel_response = (
-                self.youtube.channels().list(part="snippet", id=channel_id).execute()
-            )
-            if not channel_response.get("items"):
-                return {"error": f"Channel not found: {channel_id}"}
+        """Get videos from a channel with performance metrics and outlier analysis.
 
-            channel_name = channel_response["items"][0]["snippet"]["title"]
+        Videos come from the uploads playlist (1 quota unit per page vs 100 for
+        search). The channel lookup is skipped when the name and playlist are known.
+        """
+        try:
             published_after = datetime.now(timezone.utc) - timedelta(days=days_back)
 
-            search_response = (
-                self.youtube.search()
-                .list(
-                    part="id",
-                    channelId=channel_id,
-                    type="video",
-                    order="date",
-                    publishedAfter=published_after.isoformat(),
-                    maxResults=max_results,
+            if channel_name is None:
+                channel_name = self._channel_names.get(channel_id)
+            uploads_playlist_id = self._uploads_playlists.get(channel_id)
+            if channel_name is None or uploads_playlist_id is None:
+                channel_response = (
+                    self.youtube.channels()
+                    .list(
+                        part="snippet,contentDetails",
+                        id=channel_id,
+                        fields=CHANNEL_UPLOADS_FIELDS,
+                    )
+                    .execute()
                 )
-                .execute()
-            )
+                if not channel_response.get("items"):
+                    return {"error": f"Channel not found: {channel_id}"}
 
-            video_ids = [
-                item["id"]["videoId"] for item in search_response.get("items", [])
-            ]
+                item = channel_response["items"][0]
+                uploads_playlist_id = item["contentDetails"]["relatedPlaylists"]["uploads"]
+                self._channel_names[channel_id] = item["snippet"]["title"]
+                self._uploads_playlists[channel_id] = uploads_playlist_id
+                if channel_name is None:
+                    channel_name = item["snippet"]["title"]
+
+            video_ids = self._recent_upload_ids(
+                uploads_playlist_id, published_after, max_results
+            )
 
             if not video_ids:
                 return ChannelVideosResponse(
@@ -212,23 +403,21 @@ class YouTubeService:
                     videos=[],
                 )
 
-            view_counts = [v.view_count for v in videos]
-            avg_views = statistics.mean(view_counts)
-            std_dev_views = (
-                statistics.stdev(view_counts) if len(view_counts) > 1 else 0.0
-            )
+            avg_views, std_dev_views = _mean_stdev([v.view_count for v in videos])
 
-            for video in videos:
-                if std_dev_views > 0:
+            if std_dev_views > 0:
+                for video in videos:
                     video.outlier_score = round(
                         (video.view_count - avg_views) / std_dev_views, 2
                     )
                     video.is_outlier = video.outlier_score > 2.0
-                else:
+            else:
+                for video in videos:
                     video.outlier_score = 0.0
                     video.is_outlier = False
 
-            videos.sort(key=lambda v: v.outlier_score or 0, reverse=True)
+            # Every video has a score now, so sort on the attribute directly.
+            videos.sort(key=attrgetter("outlier_score"), reverse=True)
 
             return ChannelVideosResponse(
                 channel_name=channel_name,
@@ -266,6 +455,7 @@ class YouTubeService:
                 "type": "video",
                 "order": order,
                 "maxResults": max_results,
+                "fields": VIDEO_SEARCH_FIELDS,
             }
 
             if days_back is not None:
@@ -290,20 +480,12 @@ class YouTubeService:
 
             videos = self._fetch_video_details(video_ids)
             avg_views = (
-                statistics.mean([v.view_count for v in videos]) if videos else 0.0
+                sum(v.view_count for v in videos) / len(videos) if videos else 0.0
             )
 
-            channel_counts: dict[str, int] = {}
-            for video in videos:
-                channel_counts[video.channel_name] = (
-                    channel_counts.get(video.channel_name, 0) + 1
-                )
-
+            channel_counts = Counter(video.channel_name for video in videos)
             top_channels = [
-                {"name": name, "video_count": count}
-                for name, count in sorted(
-                    channel_counts.items(), key=lambda x: x[1], reverse=True
-                )[:5]
+                TopChannel(name, count) for name, count in channel_counts.most_common(5)
             ]
 
             return SearchResponse(
@@ -319,15 +501,47 @@ class YouTubeService:
         except Exception as e:
             return {"error": f"Error searching videos: {str(e)}"}
 
-    def get_transcript(self, video_id: str, max_chars: int = 50000) -> dict:
-        """Get video transcript/captions."""
+    def get_transcript(
+        self, video_id: str, max_chars: int = 50000, use_cache: bool = True
+    ) -> dict:
+        """Get video transcript/captions.
+
+        Successful results are cached on disk per (video, max_chars) for
+        TRANSCRIPT_CACHE_TTL; use_cache=False forces a fetch (and refreshes it).
+        """
+        cache_path = None
+        if VIDEO_ID_RE.match(video_id):
+            cache_path = TRANSCRIPT_CACHE_DIR / f"{video_id}-{max_chars}.json"
+            if use_cache:
+                cached = _read_transcript_cache(cache_path)
+                if cached is not None:
+                    return cached
+
+        result = None
         supadata_key = os.environ.get("SUPADATA_API_KEY")
         if supadata_key:
             result = self._get_transcript_supadata(video_id, supadata_key, max_chars)
-            if "error" not in result:
-                return result
-
-        return self._get_transcript_youtube_api(video_id, max_chars)
+        if result is None or "error" in result:
+            result = self._get_transcript_youtube_api(video_id, max_chars)
+
+        if cache_path is not None and "error" not in result:
+            _write_transcript_cache(cache_path, result)
+        return result
+
+    def get_transcripts(
+        self, video_ids: list[str], max_chars: int = 50000, use_cache: bool = True
+    ) -> list[dict]:
+        """Get transcripts for several videos concurrently, in input order."""
+        if len(video_ids) <= 1:
+            return [self.get_transcript(vid, max_chars, use_cache) for vid in video_ids]
+        with ThreadPoolExecutor(
+            max_workers=min(len(video_ids), MAX_TRANSCRIPT_WORKERS)
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda vid: self.get_transcript(vid, max_chars, use_cache), video_ids
+                )
+            )
 
     def _get_transcript_supadata(
         self, video_id: str, api_key: str, max_chars: int = 50000
@@ -339,9 +553,10 @@ class YouTubeService:
             else:
                 url = f"https://youtu.be/{video_id}"
 
-            response = requests.get(
+            response = self._http.get(
                 "https://api.supadata.ai/v1/transcript",
-                params={"url": url},
+                # Plain text skips the per-segment offset/duration objects.
+                params={"url": url, "text": "true"},
                 headers={"x-api-key": api_key},
                 timeout=30,
             )
@@ -353,11 +568,12 @@ class YouTubeService:
             if response.status_code != 200:
                 return {"error": f"Supadata API error: {response.status_code}"}
 
-            data = response.json()
+            data = orjson.loads(response.content)
             content = data.get("content", [])
             if isinstance(content, list):
-                full_text = " ".join(
-                    item.get("text", "") for item in content if isinstance(item, dict)
+                full_text = _join_capped(
+                    (item.get("text", "") for item in content if isinstance(item, dict)),
+                    max_chars,
                 )
             else:
                 full_text = str(content)
@@ -382,19 +598,28 @@ class YouTubeService:
 
     def _get_transcript_youtube_api(self, video_id: str, max_chars: int = 50000) -> dict:
         """Get transcript via youtube-transcript-api (fallback)."""
+        # Imported here so search/channel runs and Supadata hits don't pay for it.
+        from youtube_transcript_api import YouTubeTranscriptApi
+        from youtube_transcript_api._errors import (
+            NoTranscriptFound,
+            TranscriptsDisabled,
+            VideoUnavailable,
+        )
+
         try:
-            api = YouTubeTranscriptApi()
+            # List once and pick from the manifest; api.fetch() would list
+            # again on every language miss.
+            transcript_list = YouTubeTranscriptApi().list(video_id)
             try:
-                transcript = api.fetch(video_id, languages=["en"])
-                language = "en"
+                track = transcript_list.find_transcript(["en"])
             except NoTranscriptFound:
-                transcript_list = api.list(video_id)
-                transcript = transcript_list.find_transcript(
+                track = transcript_list.find_transcript(
                     [t.language_code for t in transcript_list]
-                ).fetch()
-                language = transcript_list[0].language_code if transcript_list else "unknown"
+                )
+            transcript = track.fetch()
+            language = track.language_code
 
-            full_text = " ".join([snippet.text for snippet in transcript])
+            full_text = _join_capped((snippet.text for snippet in transcript), max_chars)
 
             if len(full_text) > max_chars:
                 full_text = full_text[:max_chars] + "... [truncated]"
@@ -402,7 +627,7 @@ class YouTubeService:
             return {
                 "video_id": video_id,
                 "language": language,
-                "is_generated": getattr(transcript, "is_generated", False),
+                "is_generated": track.is_generated,
                 "transcript": full_text,
                 "source": "youtube-transcript-api",
             }
@@ -416,65 +641,117 @@ class YouTubeService:
         except Exception as e:
             return {"error": f"Error fetching transcript: {str(e)}"}
 
-    def _parse_channel_input(self, channel_input: str) -> str | None:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_channel_input(channel_input: str) -> str | None:
         """Parse channel input and return channel ID or @handle."""
         channel_input = channel_input.strip()
 
         if channel_input.startswith("@"):
             return channel_input
 
-        url_patterns = [
-            r"(?:https?://)?(?:www\.)?youtube\.com/@([\w-]+)",
-            r"(?:https?://)?(?:www\.)?youtube\.com/channel/(UC[\w-]+)",
-            r"(?:https?://)?(?:www\.)?youtube\.com/c/([\w-]+)",
-        ]
-
-        for pattern in url_patterns:
-            match = re.match(pattern, channel_input)
-            if match:
-                result = match.group(1)
-                if not result.startswith("UC"):
-                    return f"@{result}"
-                return result
+        match = "youtube.com" in channel_input and CHANNEL_URL_RE.match(channel_input)
+        if match:
+            result = match.group(match.lastgroup)
+            if not result.startswith("UC"):
+                return f"@{result}"
+            return result
 
         if channel_input.startswith("UC"):
             return channel_input
 
-        if re.match(r"^[\w-]+$", channel_input):
+        if BARE_HANDLE_RE.match(channel_input):
             return f"@{channel_input}"
 
         return None
 
-    def _fetch_video_details(self, video_ids: list[str]) -> list[Video]:
-        """Fetch detailed video information for a list of video IDs."""
-        videos = []
-
-        for i in range(0, len(video_ids), 50):
-            batch_ids = video_ids[i : i + 50]
+    def _recent_upload_ids(
+        self, playlist_id: str, published_after: datetime, max_results: int
+    ) -> list[str]:
+        """Page through an uploads playlist (newest first) until the cutoff date."""
+        video_ids: list[str] = []
+        page_token = None
 
+        while len(video_ids) < max_results:
             response = (
-                self.youtube.videos()
-                .list(part="snippet,statistics", id=",".join(batch_ids))
+                self.youtube.playlistItems()
+                .list(
+                    part="contentDetails",
+                    playlistId=playlist_id,
+                    maxResults=min(50, max_results - len(video_ids)),
+                    pageToken=page_token,
+                    fields=PLAYLIST_ITEM_FIELDS,
+                )
                 .execute()
             )
 
             for item in response.get("items", []):
-                video = self._parse_video_item(item)
+                details = item["contentDetails"]
+                published = details.get("videoPublishedAt")
+                if not published:
+                    continue  # private or deleted upload
+                published_at = datetime.fromisoformat(published)
+                if published_at < published_after:
+                    return video_ids
+                video_ids.append(details["videoId"])
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+        return video_ids[:max_results]
+
+    def _fetch_video_details(self, video_ids: list[str]) -> list[Video]:
+        """Fetch detailed video information for a list of video IDs."""
+        batches = [
+            video_ids[i : i + VIDEOS_PER_REQUEST]
+            for i in range(0, len(video_ids), VIDEOS_PER_REQUEST)
+        ]
+
+        if len(batches) <= 1:
+            responses = [self._fetch_video_batch(batch) for batch in batches]
+        else:
+            # httplib2 connections aren't thread-safe, so each batch gets its own.
+            with ThreadPoolExecutor(
+                max_workers=min(len(batches), MAX_DETAIL_WORKERS)
+            ) as executor:
+                responses = list(
+                    executor.map(
+                        lambda batch: self._fetch_video_batch(batch, http=build_http()),
+                        batches,
+                    )
+                )
+
+        now = datetime.now(timezone.utc)
+        videos = []
+        for items in responses:
+            for item in items:
+                video = self._parse_video_item(item, now)
                 if video:
                     videos.append(video)
 
         return videos
 
-    def _parse_video_item(self, item: dict) -> Video | None:
-        """Parse a YouTube API video item into a Video."""
+    def _fetch_video_batch(self, batch_ids: list[str], http=None) -> list[dict]:
+        """Fetch one videos().list page of up to 50 IDs."""
+        response = (
+            self.youtube.videos()
+            .list(part="snippet,statistics", id=",".join(batch_ids), fields=VIDEO_FIELDS)
+            .execute(http=http)
+        )
+        return response.get("items", [])
+
+    def _parse_video_item(self, item: dict, now: datetime | None = None) -> Video | None:
+        """Parse a YouTube API video item into a Video, aged relative to now."""
+        if now is None:
+            now = datetime.now(timezone.utc)
         try:
             snippet = item["snippet"]
             stats = item.get("statistics", {})
 
             video_id = item["id"]
-            published_at = datetime.fromisoformat(
-                snippet["publishedAt"].replace("Z", "+00:00")
-            )
+            # 3.11+ fromisoformat parses the trailing "Z" itself.
+            published_at = datetime.fromisoformat(snippet["publishedAt"])
 
             view_count = int(stats.get("viewCount", 0))
             like_count = int(stats.get("likeCount", 0))
@@ -484,7 +761,7 @@ class YouTubeService:
             if view_count > 0:
                 engagement_rate = (like_count + comment_count) / view_count
 
-            days_since_published = (datetime.now(timezone.utc) - published_at).days
+            days_since_published = (now - published_at).days
             views_per_day = view_count / max(days_since_published, 1)
 
             return Video(
@@ -520,52 +797,66 @@ def format_number(n: int | float) -> str:
 
 def print_channel_videos(result: ChannelVideosResponse) -> None:
     """Pretty print channel videos result."""
-    print(f"\n{'=' * 60}")
-    print(f"Channel: {result.channel_name}")
-    print(f"Period: Last {result.period_days} days")
-    print(f"Videos: {result.total_videos}")
-    print(f"Avg Views: {format_number(result.avg_views)}")
-    print(f"{'=' * 60}\n")
+    lines = [
+        f"\n{RULE}",
+        f"Channel: {result.channel_name}",
+        f"Period: Last {result.period_days} days",
+        f"Videos: {result.total_videos}",
+        f"Avg Views: {format_number(result.avg_views)}",
+        f"{RULE}\n",
+    ]
 
     if not result.videos:
-        print("No videos found in this period.")
-        return
+        lines.append("No videos found in this period.")
+    else:
+        lines.append("Top Videos by Outlier Score:\n")
+        for i, video in enumerate(result.videos[:10], 1):
+            outlier = f"[OUTLIER {video.outlier_score:.1f}x]" if video.is_outlier else ""
+            lines.append(f"{i}. {video.title}")
+            lines.append(
+                f"   Views: {format_number(video.view_count)} | "
+                f"Engagement: {video.engagement_rate:.2%} | "
+                f"Score: {video.outlier_score:.2f} {outlier}"
+            )
+            lines.append(f"   {video.url}\n")
 
-    print("Top Videos by Outlier Score:\n")
-    for i, video in enumerate(result.videos[:10], 1):
-        outlier = f"[OUTLIER {video.outlier_score:.1f}x]" if video.is_outlier else ""
-        print(f"{i}. {video.title}")
-        print(
-            f"   Views: {format_number(video.view_count)} | "
-            f"Engagement: {video.engagement_rate:.2%} | "
-            f"Score: {video.outlier_score:.2f} {outlier}"
-        )
-        print(f"   {video.url}\n")
+    print("\n".join(lines))
 
 
 def print_search_results(result: SearchResponse) -> None:
     """Pretty print search results."""
-    print(f"\n{'=' * 60}")
-    print(f"Search: {result.query}")
-    print(f"Results: {result.total_results:,}")
-    print(f"Avg Views: {format_number(result.avg_views)}")
-    print(f"{'=' * 60}\n")
+    lines = [
+        f"\n{RULE}",
+        f"Search: {result.query}",
+        f"Results: {result.total_results:,}",
+        f"Avg Views: {format_number(result.avg_views)}",
+        f"{RULE}\n",
+    ]
 
     if result.top_channels:
-        print("Top Channels:")
+        lines.append("Top Channels:")
         for ch in result.top_channels:
-            print(f"  - {ch['name']} ({ch['video_count']} videos)")
-        print()
+            lines.append(f"  - {ch.name} ({ch.video_count} videos)")
+        lines.append("")
 
     if not result.videos:
-        print("No videos found.")
-        return
+        lines.append("No videos found.")
+    else:
+        lines.append("Videos:\n")
+        for i, video in enumerate(result.videos[:10], 1):
+            lines.append(f"{i}. {video.title}")
+            lines.append(
+                f"   Channel: {video.channel_name} | Views: {format_number(video.view_count)}"
+            )
+            lines.append(f"   {video.url}\n")
 
-    print("Videos:\n")
-    for i, video in enumerate(result.videos[:10], 1):
-        print(f"{i}. {video.title}")
-        print(f"   Channel: {video.channel_name} | Views: {format_number(video.view_count)}")
-        print(f"   {video.url}\n")
+    print("\n".join(lines))
+
+
+def print_json(obj: Any) -> None:
+    """Write obj as indented JSON; dataclasses are serialized natively."""
+    sys.stdout.buffer.write(orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2))
+    sys.stdout.buffer.write(b"\n")
 
 
 def print_transcript(result: dict) -> None:
@@ -574,11 +865,14 @@ def print_transcript(result: dict) -> None:
         print(f"Error: {result['error']}")
         return
 
-    print(f"\n{'=' * 60}")
-    print(f"Video ID: {result['video_id']}")
-    print(f"Language: {result['language']}")
-    print(f"{'=' * 60}\n")
-    print(result["transcript"])
+    lines = [
+        f"\n{RULE}",
+        f"Video ID: {result['video_id']}",
+        f"Language: {result['language']}",
+        f"{RULE}\n",
+        result["transcript"],
+    ]
+    print("\n".join(lines))
 
 
 # =============================================================================
@@ -595,6 +889,7 @@ Examples:
     uv run .claude/skills/youtube-repurpose/scripts/youtube.py search_videos "AI agents" --max 20 --order view_count
     uv run .claude/skills/youtube-repurpose/scripts/youtube.py get_channel_videos @mkbhd --days 30
     uv run .claude/skills/youtube-repurpose/scripts/youtube.py get_transcript dQw4w9WgXcQ
+    uv run .claude/skills/youtube-repurpose/scripts/youtube.py get_transcripts dQw4w9WgXcQ jNQXAC9IVRw
         """,
     )
 
@@ -631,8 +926,24 @@ Examples:
     p_transcript.add_argument(
         "--max-chars", type=int, default=50000, help="Max transcript chars"
     )
+    p_transcript.add_argument(
+        "--no-cache", action="store_true", help="Fetch even if a cached transcript exists"
+    )
     p_transcript.add_argument("--json", action="store_true", help="Output as JSON")
 
+    # get_transcripts
+    p_transcripts = subparsers.add_parser(
+        "get_transcripts", help="Get transcripts for several videos concurrently"
+    )
+    p_transcripts.add_argument("video_ids", nargs="+", help="YouTube video IDs or URLs")
+    p_transcripts.add_argument(
+        "--max-chars", type=int, default=50000, help="Max transcript chars per video"
+    )
+    p_transcripts.add_argument(
+        "--no-cache", action="store_true", help="Fetch even if cached transcripts exist"
+    )
+    p_transcripts.add_argument("--json", action="store_true", help="Output as JSON")
+
     args = parser.parse_args()
 
     api_key = os.environ.get("YOUTUBE_API_KEY")
@@ -653,7 +964,7 @@ Examples:
             print(f"Error: {result['error']}", file=sys.stderr)
             sys.exit(1)
         if args.json:
-            print(json.dumps(asdict(result), indent=2, default=str))
+            print_json(result)
         else:
             print_search_results(result)
 
@@ -664,6 +975,7 @@ Examples:
             sys.exit(1)
         result = service.get_channel_videos(
             channel_id=channel_info.channel_id,
+            channel_name=channel_info.name,
             days_back=args.days,
             max_results=args.max,
         )
@@ -671,28 +983,42 @@ Examples:
             print(f"Error: {result['error']}", file=sys.stderr)
             sys.exit(1)
         if args.json:
-            print(json.dumps(asdict(result), indent=2, default=str))
+            print_json(result)
         else:
             print_channel_videos(result)
 
     elif args.command == "get_transcript":
-        vid = args.video_id
-        if "youtube.com" in vid:
-            vid = vid.split("v=")[-1].split("&")[0]
-        elif "youtu.be" in vid:
-            vid = vid.split("/")[-1].split("?")[0]
-        result = service.get_transcript(vid, max_chars=args.max_chars)
+        vid = _extract_video_id(args.video_id)
+        result = service.get_transcript(
+            vid, max_chars=args.max_chars, use_cache=not args.no_cache
+        )
         if "error" in result:
             if args.json:
-                print(json.dumps(result, indent=2))
+                print_json(result)
             else:
                 print(f"Error: {result['error']}", file=sys.stderr)
             sys.exit(1)
         if args.json:
-            print(json.dumps(result, indent=2))
+            print_json(result)
         else:
             print_transcript(result)
 
+    elif args.command == "get_transcripts":
+        vids = [_extract_video_id(v) for v in args.video_ids]
+        results = service.get_transcripts(
+            vids, max_chars=args.max_chars, use_cache=not args.no_cache
+        )
+        if args.json:
+            print_json(results)
+        else:
+            for result in results:
+                if "error" in result:
+                    print(f"Error: {result['error']}", file=sys.stderr)
+                else:
+                    print_transcript(result)
+        if any("error" in result for result in results):
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -1,8 +1,10 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
-#     "todoist-api-python",
+#     "todoist-api-python>=3,<4",
 #     "python-dotenv",
+#     "requests",
+#     "orjson",
 # ]
 # ///
 """
@@ -19,33 +21,65 @@ Usage:
 """
 
 import argparse
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
+import re
 import signal
 import subprocess
 import sys
 import threading
 import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
+from queue import Queue
 
+import orjson
+import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from todoist_api_python.api import TodoistAPI
+from urllib3.util.retry import Retry
 
 REPO_ROOT = Path(__file__).resolve().parent
+_REPO_PREFIX = f"{REPO_ROOT}/"
+_STRIPPED_ENV = frozenset({"CLAUDECODE", "ANTHROPIC_API_KEY"})
+_CLAUDE_FLAGS = {  # keyed by verbose
+    False: ("--model", "sonnet", "--output-format", "json"),
+    True: ("--model", "sonnet", "--output-format", "stream-json", "--verbose"),
+}
 DEFAULT_TIMEOUT = 300  # 5 minutes per task
 MAX_RETRIES = 3  # give up after this many failures
+PIPE_BUFSIZE = 64 * 1024  # read agent output in large chunks
+KILL_GRACE = 2  # seconds between SIGTERM and SIGKILL
+PROJECT_CACHE_PATH = Path.home() / ".agent_worker_cache.json"
+PROJECT_CACHE_TTL = 7 * 24 * 3600  # project name -> id mappings rarely change
 
 log = logging.getLogger("agent_worker")
 log.propagate = False  # prevent third-party DEBUG noise via root logger
 
 
+class _ConsoleHandler(logging.StreamHandler):
+    """Writes the bare message, skipping the Formatter unless there's a traceback."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if record.exc_info or record.stack_info:
+            return super().format(record)
+        return record.getMessage()
+
+
 def setup_logging(watch: bool = False, verbose: bool = False):
     """Configure logging — console always, rotating file handler in --watch mode."""
     log.setLevel(logging.DEBUG if verbose else logging.INFO)
 
-    console = logging.StreamHandler()
+    console = _ConsoleHandler()
     console.setLevel(logging.DEBUG if verbose else logging.INFO)
     console.setFormatter(logging.Formatter("%(message)s"))
     log.addHandler(console)
@@ -60,172 +94,511 @@ def setup_logging(watch: bool = False, verbose: bool = False):
 
 
 class TodoistQueue:
-    """Wraps all Todoist API calls for the worker."""
+    """Wraps all Todoist API calls for the worker.
+
+    Writes (comments, label updates) are added to a caller-owned batch of Sync
+    API commands and sent together by flush(), so each task's outcome costs
+    one round-trip and concurrent tasks never share a batch.
+    """
 
     RETRY_PREFIX = "agent-retry-"
+    RETRY_PREFIX_LEN = len(RETRY_PREFIX)
+    TERMINAL_LABELS = frozenset({"agent-done", "agent-failed"})
+    RECENT_WINDOW = 60  # seconds a finished task is shielded from re-dispatch
+    RECENT_MAX = 256
+    FILTER_SPECIAL_RE = re.compile(r"([&|!(),\\])")
+    SYNC_URL = "https://api.todoist.com/api/v1/sync"
 
     def __init__(self, token: str):
-        self.api = TodoistAPI(token)
+        self.token = token
+        # One keep-alive pool shared by the SDK and Sync API calls. POST is
+        # retried too: Sync commands carry a uuid, so replays are idempotent.
+        self.http = requests.Session()
+        self.http.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=None,
+            ),
+        ))
+        self.api = TodoistAPI(token, session=self.http)
+        self._sync_token = "*"
+        self._next_sync_token: str | None = None
+        self._unseen: set[str] = set()  # changed open tasks the task list hasn't shown yet
+        self._project_names: dict[str, str] = {}
+        self._recent: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()  # guards _recent under --concurrency
+
+    def find_project_id(self, name: str, *, use_cache: bool = True) -> str | None:
+        """Find a Todoist project by name (case-insensitive).
+
+        Ids are cached on disk per token for PROJECT_CACHE_TTL; a hit is
+        confirmed with get_project() (which also supplies the current name), and
+        an entry that no longer resolves to this name is dropped and rescanned.
+        use_cache=False forces a fresh lookup (and refreshes the cache).
+        """
+        target = name.casefold()
+        token_key = hashlib.blake2b(self.token.encode(), digest_size=8).hexdigest()
+        try:
+            cache = json.loads(PROJECT_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            cache = {}
+        # Anything that isn't the expected shape is treated as a miss.
+        if not isinstance(cache, dict):
+            cache = {}
+        entries = cache.get(token_key)
+        if not isinstance(entries, dict):
+            entries = cache[token_key] = {}
+
+        entry = entries.pop(target, None)
+        if use_cache and isinstance(entry, dict):
+            try:
+                fresh = time.time() - entry["ts"] < PROJECT_CACHE_TTL
+                project_id = entry["id"]
+            except (KeyError, TypeError):
+                fresh = False
+            if fresh and isinstance(project_id, str):
+                current = self._current_name(project_id)
+                if current is not None and current.casefold() == target:
+                    self._project_names[project_id] = current
+                    entries[target] = entry
+                    return project_id
+                log.debug("Cached project id for '%s' is stale; rescanning.", name)
+
+        project = self._scan_projects(target)
+        if project is None:
+            if entry is not None:
+                self._write_project_cache(cache)  # drop the stale entry
+            return None
+        self._project_names[project.id] = project.name
+        entries[target] = {"id": project.id, "ts": time.time()}
+        self._write_project_cache(cache)
+        return project.id
+
+    @staticmethod
+    def _write_project_cache(cache: dict):
+        # Per-process tmp name: several workers may start at once.
+        tmp = PROJECT_CACHE_PATH.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(cache))
+            os.replace(tmp, PROJECT_CACHE_PATH)
+        except OSError as e:
+            tmp.unlink(missing_ok=True)
+            log.debug("Could not write project cache: %s", e)
+
+    def _current_name(self, project_id: str) -> str | None:
+        """Return the project's current name, or None if it can't be fetched."""
+        try:
+            return self.api.get_project(project_id).name
+        except requests.RequestException as e:
+            log.debug("Could not fetch project %s: %s", project_id, e)
+            return None
+
+    def _scan_projects(self, target: str):
+        """Page through projects for a casefolded name.
 
-    def find_project_id(self, name: str) -> str | None:
-        """Find a Todoist project by name (case-insensitive)."""
-        target = name.lower()
+        Returning from inside the loop closes the page iterator, so later pages
+        are never fetched.
+        """
         for page in self.api.get_projects():
             for project in page:
-                if project.name.lower() == target:
-                    return project.id
+                if project.name.casefold() == target:
+                    return project
         return None
 
-    def get_tasks(self, project_id: str) -> list:
-        """Fetch all tasks for a project."""
-        tasks = []
-        for page in self.api.get_tasks(project_id=project_id):
-            tasks.extend(page)
-        return tasks
-
-    def comment(self, task_id: str, message: str):
-        """Add a comment to a Todoist task."""
+    def _filter_by_name(self, name: str) -> tuple[list, Iterator] | None:
+        """Start a #name task filter: (first page, remaining pages), or None if it errors."""
+        escaped = self.FILTER_SPECIAL_RE.sub(r"\\\1", name)
+        query = " & ".join([f"#{escaped}", *(f"!@{label}" for label in sorted(self.TERMINAL_LABELS))])
         try:
-            self.api.add_comment(content=message, task_id=task_id)
-        except Exception as e:
+            pages = self.api.filter_tasks(query=query)
+            return next(pages, []), pages
+        except requests.RequestException as e:
+            log.debug("Task filter for #%s failed: %s", name, e)
+            return None
+
+    def iter_tasks(self, project_id: str) -> Iterator:
+        """Yield a project's tasks page by page, excluding terminal ones server-side when possible.
+
+        A renamed project makes the #name filter error or match nothing, so in
+        those cases the current name is re-read and the filter retried; if it
+        still errors, tasks are listed by project id instead.
+        """
+        name = self._project_names.get(project_id)
+        listing = self._filter_by_name(name) if name else None
+        if name and (listing is None or not listing[0]):
+            current = self._current_name(project_id)
+            if current and current != name:
+                log.info("Project renamed to '%s'.", current)
+                self._project_names[project_id] = current
+                listing = self._filter_by_name(current)
+        if listing is not None:
+            first, rest = listing
+            pages = itertools.chain([first], rest)
+        else:
+            pages = self.api.get_tasks(project_id=project_id)
+        for page in pages:
+            # Project names aren't unique, so the #name filter can match tasks
+            # from a same-named project; keep only this one's.
+            yield from (task for task in page if task.project_id == project_id)
+
+    def has_changes(self, project_id: str) -> bool:
+        """Check via incremental sync whether any task in the project changed.
+
+        The first call always reports changes; the token advances on mark_synced().
+        """
+        resp = self.http.post(
+            self.SYNC_URL,
+            headers={"Authorization": f"Bearer {self.token}"},
+            data={"sync_token": self._sync_token, "resource_types": '["items"]'},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        self._next_sync_token = data.get("sync_token")
+        changed = [item for item in data.get("items", []) if item.get("project_id") == project_id]
+        # Open, non-terminal tasks we must see in the task list before the
+        # token may advance; the filter can lag behind the sync delta.
+        self._unseen = {
+            item["id"] for item in changed
+            if "id" in item and not item.get("checked") and not item.get("is_deleted")
+            and self.TERMINAL_LABELS.isdisjoint(item.get("labels") or ())
+        }
+        return self._sync_token == "*" or bool(changed)
+
+    def mark_seen(self, task_id: str):
+        """Note that a changed task has shown up in the task list."""
+        self._unseen.discard(task_id)
+
+    def mark_synced(self):
+        """Advance the sync token once a cycle has handled everything it saw.
+
+        If a changed task never appeared in the task list, the token is kept so
+        the next cycle checks again instead of forgetting the change.
+        """
+        if self._unseen:
+            log.debug("%d changed task(s) not listed yet; re-checking next poll.", len(self._unseen))
+            return
+        if self._next_sync_token:
+            self._sync_token = self._next_sync_token
+            self._next_sync_token = None
+
+    def recently_finished(self, task_id: str) -> bool:
+        """True if the task reached done/failed within RECENT_WINDOW.
+
+        Guards against re-dispatching a task whose label update hasn't shown up
+        in the task list yet.
+        """
+        finished_at = self._recent.get(task_id)
+        return finished_at is not None and time.monotonic() - finished_at < self.RECENT_WINDOW
+
+    def remember_finished(self, task_id: str):
+        """Record that a task reached a terminal state."""
+        with self._lock:
+            self._recent[task_id] = time.monotonic()
+            self._recent.move_to_end(task_id)
+            if len(self._recent) > self.RECENT_MAX:
+                self._recent.popitem(last=False)
+
+    @staticmethod
+    def _command(command_type: str, args: dict) -> dict:
+        return {
+            "type": command_type,
+            "uuid": str(uuid.uuid4()),
+            "temp_id": str(uuid.uuid4()),
+            "args": args,
+        }
+
+    def flush(self, commands: list[dict]):
+        """Send a batch of commands in a single Sync API request.
+
+        Comment-only batches are non-fatal on network errors; batches that
+        update labels raise so the caller's retry/backoff kicks in.
+        """
+        if not commands:
+            return
+        try:
+            resp = self.http.post(
+                self.SYNC_URL,
+                headers={"Authorization": f"Bearer {self.token}"},
+                data={"commands": json.dumps(commands)},
+                timeout=30,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as e:
+            if any(c["type"] != "note_add" for c in commands):
+                raise
             log.warning("Failed to add comment: %s", e)
-
-    def mark_done(self, task_id: str, labels: list[str]):
-        """Remove retry labels and add agent-done label."""
-        done_labels = [l for l in labels if not l.startswith(self.RETRY_PREFIX)]
-        done_labels.append("agent-done")
-        self.api.update_task(task_id=task_id, labels=done_labels)
-
-    def mark_failed(self, task_id: str, labels: list[str]):
-        """Remove retry labels and add agent-failed label."""
-        failed_labels = [l for l in labels if not l.startswith(self.RETRY_PREFIX)]
-        failed_labels.append("agent-failed")
-        self.api.update_task(task_id=task_id, labels=failed_labels)
-
-    def get_retry_count(self, labels: list[str]) -> int:
-        """Extract retry count from task labels."""
+            return
+
+        status = resp.json().get("sync_status", {})
+        for command in commands:
+            result = status.get(command["uuid"])
+            if result != "ok":
+                log.warning("Todoist %s failed: %s", command["type"], result)
+
+    def comment(self, batch: list[dict], task_id: str, message: str):
+        """Add a comment on a Todoist task to `batch`."""
+        batch.append(self._command("note_add", {"item_id": task_id, "content": message}))
+
+    def post_comment(self, task_id: str, message: str):
+        """Post a comment right away, on its own. Non-fatal."""
+        self.flush([self._command("note_add", {"item_id": task_id, "content": message})])
+
+    def mark_done(self, batch: list[dict], task_id: str, labels: list[str]):
+        """Add the agent-done label update to `batch`. `labels` must already exclude retry labels."""
+        batch.append(self._command("item_update", {"id": task_id, "labels": [*labels, "agent-done"]}))
+
+    def mark_failed(self, batch: list[dict], task_id: str, labels: list[str]):
+        """Add the agent-failed label update to `batch`. `labels` must already exclude retry labels."""
+        batch.append(self._command("item_update", {"id": task_id, "labels": [*labels, "agent-failed"]}))
+
+    def classify_labels(self, labels: list[str]) -> tuple[bool, int, list[str]]:
+        """Return (is_terminal, retry count, non-retry labels); stops early on a terminal label."""
+        other = []
+        count = 0
         for label in labels:
+            if label in self.TERMINAL_LABELS:
+                return True, count, other
             if label.startswith(self.RETRY_PREFIX):
                 try:
-                    return int(label[len(self.RETRY_PREFIX):])
+                    count = int(label[self.RETRY_PREFIX_LEN:])
                 except ValueError:
                     pass
-        return 0
+            else:
+                other.append(label)
+        return False, count, other
+
+    def set_retry(self, batch: list[dict], task_id: str, labels: list[str], count: int):
+        """Add the retry label update to `batch`. `labels` must already exclude retry labels."""
+        new_labels = [*labels, f"{self.RETRY_PREFIX}{count}"]
+        batch.append(self._command("item_update", {"id": task_id, "labels": new_labels}))
+
+
+def _describe_read(path: str) -> str:
+    short = path.removeprefix(_REPO_PREFIX)
+    lowered = short.lower()
+    if "skill" in lowered:
+        return f"📖 Reading skill: {short}"
+    if "reference" in lowered:
+        return f"📖 Reading reference: {short}"
+    return f"📖 Reading {short}"
 
-    def set_retry(self, task_id: str, labels: list[str], count: int):
-        """Update task labels with new retry count."""
-        new_labels = [l for l in labels if not l.startswith(self.RETRY_PREFIX)]
-        new_labels.append(f"{self.RETRY_PREFIX}{count}")
-        self.api.update_task(task_id=task_id, labels=new_labels)
+
+def _describe_write(path: str) -> str:
+    return f"✍️ Writing {path.removeprefix(_REPO_PREFIX)}"
+
+
+def _describe_bash(command: str) -> str:
+    command = command.lower()
+    if "airtable" in command:
+        return "📤 Pushing to Airtable"
+    if "youtube" in command:
+        return "🎬 Fetching YouTube transcript"
+    return "🔧 Running command"
+
+
+# tool name -> (input field the description depends on, describer)
+_TOOL_DESCRIBERS = {
+    "Read": ("file_path", _describe_read),
+    "Write": ("file_path", _describe_write),
+    "Bash": ("command", _describe_bash),
+    "Glob": (None, lambda _: "🔍 Searching files"),
+    "Grep": (None, lambda _: "🔍 Searching content"),
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _describe_cached(name: str, arg: str) -> str:
+    return _TOOL_DESCRIBERS[name][1](arg)
 
 
 def _describe_tool_use(name: str, input_data: dict) -> str | None:
     """Turn a tool_use event into a short human-readable status line, or None to skip."""
-    if name == "Read":
-        path = input_data.get("file_path", "")
-        short = path.replace(str(REPO_ROOT) + "/", "")
-        if "skill" in short.lower() or "SKILL" in short:
-            return f"📖 Reading skill: {short}"
-        if "reference" in short.lower():
-            return f"📖 Reading reference: {short}"
-        return f"📖 Reading {short}"
-    if name == "Write":
-        path = input_data.get("file_path", "")
-        short = path.replace(str(REPO_ROOT) + "/", "")
-        return f"✍️ Writing {short}"
-    if name == "Bash":
-        cmd = input_data.get("command", "")
-        if "airtable" in cmd.lower():
-            return "📤 Pushing to Airtable"
-        if "youtube" in cmd.lower():
-            return "🎬 Fetching YouTube transcript"
-        return "🔧 Running command"
-    if name == "Glob":
-        return "🔍 Searching files"
-    if name == "Grep":
-        return "🔍 Searching content"
-    return None
+    entry = _TOOL_DESCRIBERS.get(name)
+    if entry is None:
+        return None
+    field = entry[0]
+    # Agents repeat the same reads and commands; key the cache on the one
+    # input field that matters (stringified, so odd inputs stay hashable).
+    return _describe_cached(name, str(input_data.get(field, "")) if field else "")
+
+
+class _Watchdog:
+    """Fires timeout callbacks from one shared thread instead of a Timer thread per dispatch."""
+
+    def __init__(self):
+        self._cv = threading.Condition()
+        self._deadlines: dict[int, tuple[float, Callable[[], None]]] = {}
+        self._next_handle = 0
+        self._thread: threading.Thread | None = None
+
+    def arm(self, timeout: float, callback: Callable[[], None]) -> int:
+        """Schedule callback to run after timeout seconds. Returns a handle for disarm()."""
+        with self._cv:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="watchdog", daemon=True)
+                self._thread.start()
+            self._next_handle += 1
+            self._deadlines[self._next_handle] = (time.monotonic() + timeout, callback)
+            self._cv.notify()
+            return self._next_handle
+
+    def disarm(self, handle: int):
+        """Cancel a pending deadline. No-op if it already fired."""
+        with self._cv:
+            self._deadlines.pop(handle, None)
+
+    def _run(self):
+        while True:
+            with self._cv:
+                now = time.monotonic()
+                due = [h for h, (at, _) in self._deadlines.items() if at <= now]
+                if not due:
+                    next_at = min((at for at, _ in self._deadlines.values()), default=None)
+                    self._cv.wait(None if next_at is None else next_at - now)
+                    continue
+                callbacks = [self._deadlines.pop(h)[1] for h in due]
+            for callback in callbacks:
+                callback()
+
+
+_watchdog = _Watchdog()
+
+# Live agent processes, so an interrupt under --concurrency can kill every
+# in-flight group (SIGINT never reaches them: each has its own session).
+_children: set[subprocess.Popen] = set()
+_children_lock = threading.Lock()
+_stopping = threading.Event()
+
+
+def _kill_process_groups(procs) -> None:
+    """SIGTERM each child's process group, then SIGKILL whatever outlives KILL_GRACE."""
+    for proc in procs:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except OSError:
+            pass
+    deadline = time.monotonic() + KILL_GRACE
+    for proc in procs:
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            pass
+    # Also catches stragglers in the group that outlived the leader.
+    for proc in procs:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _kill_all_children() -> None:
+    """Stop new dispatches and kill every running agent."""
+    with _children_lock:
+        _stopping.set()
+        procs = list(_children)
+    _kill_process_groups(procs)
+
+
+@functools.cache
+def _dispatch_env() -> dict[str, str]:
+    """Environment for agent subprocesses, built once on first dispatch.
+
+    Subprocess isolation: strip sensitive env vars so the agent uses the
+    Claude Code subscription plan and can't access API keys or session state.
+    Built lazily so it sees variables loaded from .env in main().
+    """
+    return {k: v for k, v in os.environ.items() if k not in _STRIPPED_ENV}
 
 
 def dispatch(title: str, description: str | None, *,
              verbose: bool = False, timeout: int = DEFAULT_TIMEOUT) -> tuple[bool, str]:
     """Pass the ticket to Claude Code. Returns (success, summary)."""
-    prompt = title
-    if description:
-        prompt += f"\n\n{description}"
-
-    output_format = "stream-json" if verbose else "json"
-    cmd = ["claude", "-p", prompt, "--model", "sonnet", "--output-format", output_format]
-    if verbose:
-        cmd.append("--verbose")
+    prompt = f"{title}\n\n{description}" if description else title
+    cmd = ["claude", "-p", prompt, *_CLAUDE_FLAGS[verbose]]
 
     log.info("  Dispatching to Claude Code...")
-    # Subprocess isolation: strip sensitive env vars so the agent uses the
-    # Claude Code subscription plan and can't access API keys or session state.
-    env = os.environ.copy()
-    env.pop("CLAUDECODE", None)
-    env.pop("ANTHROPIC_API_KEY", None)
 
-    try:
-        proc = subprocess.Popen(
-            cmd, cwd=str(REPO_ROOT), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-            text=True, env=env, start_new_session=True,
-        )
-    except FileNotFoundError:
-        return False, "'claude' command not found"
+    with _children_lock:
+        if _stopping.is_set():
+            return False, "Interrupted"
+        try:
+            proc = subprocess.Popen(
+                cmd, cwd=str(REPO_ROOT), stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                env=_dispatch_env(), start_new_session=True, bufsize=PIPE_BUFSIZE,
+            )
+        except FileNotFoundError:
+            return False, "'claude' command not found"
+        _children.add(proc)
 
     seen = set()  # deduplicate verbose output
     result_text = ""
 
     def _kill_child():
-        """Kill the child process group."""
-        try:
-            os.killpg(proc.pid, signal.SIGTERM)
-        except OSError:
-            pass
+        """Kill the child process group: SIGTERM, then SIGKILL after a grace period."""
+        _kill_process_groups([proc])
 
-    # Watchdog timer — ensures timeout fires even when the stdout stream blocks
+    # Watchdog deadline — ensures timeout fires even when the stdout stream blocks
     timed_out = threading.Event()
+    lines: Queue[bytes | None] = Queue()
 
     def _on_timeout():
         timed_out.set()
         _kill_child()
+        lines.put(None)  # wake the verbose loop without waiting on the pipe
 
-    timer = threading.Timer(timeout, _on_timeout)
-    timer.start()
+    deadline = _watchdog.arm(timeout, _on_timeout)
 
     try:
         if verbose:
-            # Stream events to terminal only (not Todoist)
-            for line in proc.stdout:
-                line = line.strip()
-                if not line:
+            # Stream events to terminal only (not Todoist). A reader thread
+            # drains stdout so a stuck pipe can't hold us past the watchdog;
+            # both end the loop by queueing None, so we block instead of polling.
+            def _reader():
+                for raw in proc.stdout:
+                    lines.put(raw)
+                lines.put(None)
+
+            threading.Thread(target=_reader, daemon=True).start()
+            while (line := lines.get()) is not None:
+                # Only tool_use blocks and the final result are used; skip
+                # decoding the (far more numerous) other events.
+                if b'"tool_use"' not in line and b'"result"' not in line:
                     continue
                 try:
-                    event = json.loads(line)
-                except json.JSONDecodeError:
+                    event = orjson.loads(line)
+                except orjson.JSONDecodeError:
                     continue
 
-                if event.get("type") == "assistant":
-                    msg = event.get("message", {})
-                    for block in msg.get("content", []):
-                        if block.get("type") == "tool_use":
-                            desc = _describe_tool_use(block["name"], block.get("input", {}))
-                            if desc and desc not in seen:
-                                seen.add(desc)
-                                log.info("  %s", desc)
-
-                if event.get("type") == "result":
-                    result_text = event.get("result", "")
+                # Direct indexing for the two event shapes we use; anything
+                # malformed is skipped rather than walked with .get() defaults.
+                try:
+                    event_type = event["type"]
+                    if event_type == "assistant":
+                        for block in event["message"]["content"]:
+                            if block["type"] == "tool_use":
+                                desc = _describe_tool_use(block["name"], block.get("input", {}))
+                                if desc and desc not in seen:
+                                    seen.add(desc)
+                                    log.info("  %s", desc)
+                    elif event_type == "result":
+                        result_text = event["result"]
+                except (KeyError, TypeError):
+                    continue
 
         proc.wait()
 
         if not verbose:
+            # Pipes are binary so orjson parses the bytes without a decode pass.
             stdout = proc.stdout.read()
             try:
-                output = json.loads(stdout)
+                output = orjson.loads(stdout)
                 result_text = output.get("result", "")
-            except (json.JSONDecodeError, ValueError):
+            except orjson.JSONDecodeError:
                 pass
 
     except KeyboardInterrupt:
@@ -233,12 +606,14 @@ def dispatch(title: str, description: str | None, *,
         _kill_child()
         raise
     finally:
-        timer.cancel()
+        _watchdog.disarm(deadline)
+        with _children_lock:
+            _children.discard(proc)
 
     if timed_out.is_set():
         return False, f"Timed out after {timeout}s"
 
-    stderr_text = proc.stderr.read() if proc.stderr else ""
+    stderr_text = proc.stderr.read().decode(errors="replace") if proc.stderr else ""
 
     if proc.returncode == 0:
         log.info("  Done.")
@@ -256,51 +631,103 @@ def dispatch(title: str, description: str | None, *,
         return False, error_msg
 
 
-def run_once(queue: TodoistQueue, project_id: str, *, verbose: bool = False,
-             timeout: int = DEFAULT_TIMEOUT, max_retries: int = MAX_RETRIES) -> int:
-    """Process all pending tasks. Returns count processed."""
-    tasks = queue.get_tasks(project_id)
-
-    if not tasks:
-        log.info("No pending tasks.")
-        return 0
-
-    processed = 0
-    for task in tasks:
-        labels = task.labels or []
+def _run_task(queue: TodoistQueue, task, base_labels: list[str], retries: int, *,
+              verbose: bool, timeout: int, max_retries: int) -> bool:
+    """Dispatch one task and record the outcome in Todoist. Returns True on success."""
+    retry_info = f" (attempt {retries + 1}/{max_retries})" if retries > 0 else ""
+    log.info("\nTask: %s%s", task.content, retry_info)
+    # Post the pickup comment while the agent boots rather than before it. It
+    # goes out on its own so it can't carry (or lose) another task's commands.
+    pickup = threading.Thread(
+        target=queue.post_comment, args=(task.id, f"Working on it...{retry_info}"), daemon=True
+    )
+    pickup.start()
+
+    success, summary = dispatch(
+        task.content, task.description,
+        verbose=verbose, timeout=timeout,
+    )
+    pickup.join()  # keep the pickup comment ahead of the outcome
+
+    if _stopping.is_set():
+        # Killed by Ctrl+C, not a real failure: leave the task for the next run.
+        return success
+
+    outcome: list[dict] = []  # this task's commands only
+    if success:
+        queue.comment(outcome, task.id, f"Done. Ready for review.\n\n{summary}")
+        queue.mark_done(outcome, task.id, base_labels)
+        queue.remember_finished(task.id)
+        log.info("  Done. Left open for review.")
+    else:
+        retries += 1
+        if retries >= max_retries:
+            queue.comment(outcome, task.id, f"Failed after {max_retries} attempts. Giving up.\n\n{summary}")
+            queue.mark_failed(outcome, task.id, base_labels)
+            queue.remember_finished(task.id)
+            log.error("  Failed permanently after %d attempts.", max_retries)
+        else:
+            queue.comment(outcome, task.id, f"Failed (attempt {retries}/{max_retries}). Will retry.\n\n{summary}")
+            queue.set_retry(outcome, task.id, base_labels, retries)
+            log.warning("  Failed (attempt %d/%d). Will retry next run.", retries, max_retries)
 
-        if "agent-done" in labels or "agent-failed" in labels:
-            continue
+    # Outcome comment + label update go out together, per task, so a crash
+    # later in the cycle can't lose a finished task's state.
+    queue.flush(outcome)
+    return success
 
-        retries = queue.get_retry_count(labels)
-        if retries >= max_retries:
-            continue  # already gave up, skip silently
 
-        retry_info = f" (attempt {retries + 1}/{max_retries})" if retries > 0 else ""
-        log.info("\nTask: %s%s", task.content, retry_info)
-        queue.comment(task.id, f"Working on it...{retry_info}")
+def run_once(queue: TodoistQueue, project_id: str, *, verbose: bool = False,
+             timeout: int = DEFAULT_TIMEOUT, max_retries: int = MAX_RETRIES,
+             concurrency: int = 1) -> int:
+    """Process all pending tasks, up to `concurrency` at a time. Returns count dispatched."""
+    # Our own label updates count as changes, so tasks left for retry are
+    # picked up again on the following cycle.
+    if not queue.has_changes(project_id):
+        log.debug("No changes since last poll.")
+        queue.mark_synced()
+        return 0
 
-        success, summary = dispatch(
-            task.content, task.description,
-            verbose=verbose, timeout=timeout,
-        )
+    # Stream pages so the first task starts before later pages are fetched.
+    tasks = queue.iter_tasks(project_id)
+    try:
+        first = next(tasks)
+    except StopIteration:
+        log.info("No pending tasks.")
+        queue.mark_synced()
+        return 0
 
-        if success:
-            queue.comment(task.id, f"Done. Ready for review.\n\n{summary}")
-            queue.mark_done(task.id, labels)
-            log.info("  Done. Left open for review.")
-            processed += 1
-        else:
-            retries += 1
+    def runnable():
+        for task in itertools.chain([first], tasks):
+            queue.mark_seen(task.id)
+            terminal, retries, base_labels = queue.classify_labels(task.labels or [])
+            if terminal or queue.recently_finished(task.id):
+                continue
             if retries >= max_retries:
-                queue.comment(task.id, f"Failed after {max_retries} attempts. Giving up.\n\n{summary}")
-                queue.mark_failed(task.id, labels)
-                log.error("  Failed permanently after %d attempts.", max_retries)
-            else:
-                queue.comment(task.id, f"Failed (attempt {retries}/{max_retries}). Will retry.\n\n{summary}")
-                queue.set_retry(task.id, labels, retries)
-                log.warning("  Failed (attempt %d/%d). Will retry next run.", retries, max_retries)
+                continue  # already gave up, skip silently
+            yield task, base_labels, retries
 
+    options = {"verbose": verbose, "timeout": timeout, "max_retries": max_retries}
+    # Failed attempts count too: a cycle that dispatched anything isn't idle.
+    processed = 0
+    if concurrency <= 1:
+        for job in runnable():
+            _run_task(queue, *job, **options)
+            processed += 1
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            try:
+                futures = [pool.submit(_run_task, queue, *job, **options) for job in runnable()]
+                for future in futures:
+                    future.result()
+                    processed += 1
+            except KeyboardInterrupt:
+                log.info("\n  Interrupted — killing agents...")
+                pool.shutdown(wait=False, cancel_futures=True)
+                _kill_all_children()
+                raise
+
+    queue.mark_synced()
     return processed
 
 
@@ -315,6 +742,10 @@ def main():
                         help=f"Per-task timeout in seconds (default {DEFAULT_TIMEOUT})")
     parser.add_argument("--max-retries", type=int, default=MAX_RETRIES,
                         help=f"Give up after N failures (default {MAX_RETRIES})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Look up the project id instead of using the on-disk cache")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Run up to N tasks at once (default 1, sequential)")
     args = parser.parse_args()
 
     setup_logging(watch=args.watch, verbose=args.verbose)
@@ -327,7 +758,7 @@ def main():
         sys.exit(1)
 
     queue = TodoistQueue(token)
-    project_id = queue.find_project_id(args.project)
+    project_id = queue.find_project_id(args.project, use_cache=not args.no_cache)
     if not project_id:
         log.error("No '%s' project found in Todoist.", args.project)
         sys.exit(1)
@@ -340,10 +771,12 @@ def main():
         if args.watch:
             log.info("Polling every %ds. Ctrl+C to stop.\n", args.interval)
             consecutive_errors = 0
+            idle_cycles = 0
             while True:
                 try:
-                    run_once(queue, project_id, verbose=args.verbose,
-                             timeout=args.timeout, max_retries=args.max_retries)
+                    processed = run_once(queue, project_id, verbose=args.verbose,
+                                         timeout=args.timeout, max_retries=args.max_retries,
+                                         concurrency=args.concurrency)
                     consecutive_errors = 0
                 except KeyboardInterrupt:
                     raise
@@ -353,10 +786,16 @@ def main():
                     log.exception("Poll failed, retrying in %ds", backoff)
                     time.sleep(backoff)
                     continue
-                time.sleep(args.interval)
+                # Back off on idle queues, up to 10x the interval; reset on work.
+                if processed:
+                    idle_cycles = 0
+                time.sleep(min(args.interval * (2 ** idle_cycles), args.interval * 10))
+                if not processed:
+                    idle_cycles = min(idle_cycles + 1, 4)
         else:
             run_once(queue, project_id, verbose=args.verbose,
-                     timeout=args.timeout, max_retries=args.max_retries)
+                     timeout=args.timeout, max_retries=args.max_retries,
+                     concurrency=args.concurrency)
     except KeyboardInterrupt:
         log.info("\nStopped.")
         sys.exit(0)